@@ -6,45 +6,39 @@ It fetches data from the USGS, processes it, and displays it using Pydeck.
 Users can filter the data by time period and magnitude.
 """
 
+import math
 import streamlit as st
-from src.fetch import fetch_geojson
-from src.transform import validate_and_convert_geojson
-from src.ui import sidebar, render_map
-from src.viz import color_from_mag, radius_from_mag
+from src.pipeline import prefetch_all, prepare
+from src.ui import sidebar, render_map, render_table
 
 def main():
     """Main function to run the Streamlit application."""
     st.set_page_config(page_title="Earthquake Tracker", layout="wide")
     st.title("🌎 Real-time Global Earthquake Tracker")
+    prefetch_all()
 
     period, min_mag = sidebar()
     print(f"[Flow] User selected: Period='{period.value}', Min Magnitude={min_mag}")
 
     try:
-        print("[Flow] Fetching data from USGS...")
-        raw_data = fetch_geojson(period)
-        print("[Flow] Data fetched successfully.")
-
-        print("[Flow] Transforming data into DataFrame...")
-        df = validate_and_convert_geojson(raw_data)
-        print(f"[Flow] DataFrame created with {len(df)} records.")
+        # Nearby slider positions share a cached half-magnitude bucket
+        mag_bucket = math.floor(min_mag * 2) / 2
+        print(f"[Flow] Loading prepared data for magnitude bucket {mag_bucket}...")
+        df, positions, colors = prepare(period, mag_bucket)
+        print(f"[Flow] DataFrame loaded with {len(df)} records.")
 
         if "mag" in df.columns:
-            # Apply visual mappings for color and radius
-            color_cols = list(zip(*df["mag"].map(color_from_mag)))
-            df["mag_r"], df["mag_g"], df["mag_b"], df["mag_a"] = color_cols
-            df["radius"] = df["mag"].apply(radius_from_mag)
-
-            # Filter data based on user selection
+            # Narrow the bucket down to the exact user selection
             print(f"[Flow] Filtering DataFrame for magnitude >= {min_mag}...")
-            filtered_df = df[df["mag"].fillna(-1) >= min_mag]
+            mask = df["mag"].fillna(-1).ge(min_mag).to_numpy()
+            filtered_df = df[mask]
+            buffers = (positions[mask], colors[mask])
             print(f"[Flow] Filtered DataFrame has {len(filtered_df)} records.")
 
             if not filtered_df.empty:
                 print("[Flow] Rendering map and data table...")
-                render_map(filtered_df)
-                st.subheader("Raw Data")
-                st.dataframe(filtered_df, use_container_width=True)
+                render_map(filtered_df, buffers)
+                render_table(filtered_df)
             else:
                 st.info("No earthquakes found for the selected magnitude.")
                 print("[Flow] No data to render after filtering.")
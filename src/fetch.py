@@ -1,50 +1,95 @@
 """
 Fetches earthquake data from the USGS GeoJSON API.
 
-This module provides a function to fetch earthquake data for different
-time periods and caches the results to avoid excessive API calls.
+This module provides functions to fetch earthquake data for different
+time periods and caches the downloads to avoid excessive API calls.
 """
 
 import streamlit as st
 import requests
+import orjson
+import threading
 import time
 from src.enums import TimePeriod
 
 UA = {"User-Agent": "EarthquakeTracker/1.0 (sameerauf1@gmail.com)"}
 BASE = "https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary"
 
+# Last successful response per feed URL, used for conditional requests.
+# Only the period feeds are ever stored, so this holds at most one body each;
+# writes come from the prefetch threads and are serialized by the lock.
+_VALIDATORS = {}
+_VALIDATORS_LOCK = threading.Lock()
+
 @st.cache_data(ttl=600)
-def fetch_geojson(period: TimePeriod) -> dict:
+def fetch_geojson_bytes(period: TimePeriod) -> bytes:
     """
-    Fetches and validates GeoJSON data from the USGS earthquake feed.
+    Downloads the raw GeoJSON payload from the USGS earthquake feed.
+
+    Repeat downloads are sent as conditional requests using the previous
+    response's ETag and Last-Modified headers; a 304 reply reuses the
+    previous payload.
 
     Args:
         period: The time period for the data (TimePeriod.DAY, .WEEK, or .MONTH).
 
     Returns:
-        A dictionary containing the GeoJSON data.
-
-    Raises:
-        ValueError: If the fetched data is not valid GeoJSON or is missing the 'features' key.
+        The undecoded response body.
     """
     url = f"{BASE}/all_{period.value}.geojson"
+    headers = dict(UA)
+    cached = _VALIDATORS.get(url)
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     for attempt in range(3):
         try:
-            r = requests.get(url, headers=UA, timeout=15)
+            r = requests.get(url, headers=headers, timeout=15, stream=False)
+            if r.status_code == 304 and cached:
+                print(f"[Fetch] {url} not modified, reusing previous payload.")
+                return cached["content"]
             r.raise_for_status()
-            data = r.json()
 
-            # Basic data validation
-            if not isinstance(data, dict) or "features" not in data:
-                raise ValueError("Invalid GeoJSON format: 'features' key is missing.")
-
-            return data
+            etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+            with _VALIDATORS_LOCK:
+                if etag or last_modified:
+                    _VALIDATORS[url] = {"etag": etag, "last_modified": last_modified, "content": r.content}
+                else:
+                    _VALIDATORS.pop(url, None)
+            return r.content
         except requests.RequestException as e:
             st.error(f"Failed to fetch data: {e}. Retrying...")
             if attempt == 2:
                 st.exception(e)
                 raise
             time.sleep(2 ** attempt)
-        except (ValueError, TypeError) as e:
-            st.error(f"Data validation failed: {e}")
-            raise
+
+def fetch_geojson(period: TimePeriod) -> dict:
+    """
+    Fetches and validates GeoJSON data from the USGS earthquake feed.
+
+    The download itself is cached by `fetch_geojson_bytes`.
+
+    Args:
+        period: The time period for the data (TimePeriod.DAY, .WEEK, or .MONTH).
+
+    Returns:
+        A dictionary containing the GeoJSON data.
+
+    Raises:
+        ValueError: If the fetched data is not valid GeoJSON or is missing the 'features' key.
+    """
+    try:
+        data = orjson.loads(fetch_geojson_bytes(period))
+
+        # Basic data validation
+        if not isinstance(data, dict) or "features" not in data:
+            raise ValueError("Invalid GeoJSON format: 'features' key is missing.")
+
+        return data
+    except (ValueError, TypeError) as e:
+        st.error(f"Data validation failed: {e}")
+        raise
@@ -0,0 +1,220 @@
+"""
+Prepares display-ready earthquake data for the app.
+
+This module chains fetching, transformation and visual decoration into a
+single cached step, so widget interactions only need to filter an existing
+DataFrame instead of rebuilding it; filtered results are cached per
+magnitude bucket as well. Converted feeds are also persisted as
+Parquet files so new processes can skip the download and parsing.
+"""
+
+import glob
+import os
+import stat
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+from src.enums import TimePeriod
+from src.fetch import fetch_geojson, fetch_geojson_bytes
+from src.transform import arrow_geojson_to_dataframe, validate_and_convert_geojson
+from src.viz import categories_from_mags, layer_buffers, radii_from_mags
+
+# A per-user directory in the shared temp dir; see _cache_dir for the checks
+CACHE_DIR = os.path.join(
+    tempfile.gettempdir(),
+    f"earthquake-tracker-{os.getuid()}" if hasattr(os, "getuid") else "earthquake-tracker",
+)
+CACHE_TTL = 600
+
+# Periods large enough that parsing with Arrow beats building Python dicts.
+ARROW_PERIODS = {TimePeriod.MONTH}
+
+def _cache_dir():
+    """
+    Creates the Parquet cache directory and checks that it is private.
+
+    Returns:
+        The cache directory, or None if it cannot be created or could be
+        written by other users (wrong owner, loose permissions, or a symlink).
+    """
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        info = os.lstat(CACHE_DIR)
+    except OSError as e:
+        print(f"[Cache] Could not create cache directory {CACHE_DIR}. Reason: {e}")
+        return None
+    owned = not hasattr(os, "getuid") or info.st_uid == os.getuid()
+    if not stat.S_ISDIR(info.st_mode) or not owned or info.st_mode & 0o077:
+        print(f"[Cache] Not using {CACHE_DIR}: it is not a private directory owned by this user.")
+        return None
+    return CACHE_DIR
+
+def _cache_path(period: TimePeriod, bucket) -> str:
+    """Builds the Parquet cache file path for a period and time bucket."""
+    return os.path.join(CACHE_DIR, f"usgs_{period.value}_{bucket}.parquet")
+
+def _log_prefetch_result(period: TimePeriod, future) -> None:
+    """Reports a failed background download, which would otherwise be lost."""
+    e = future.exception()
+    if e is not None:
+        print(f"[Prefetch] Failed to download the {period.value} feed. Reason: {e}")
+
+@st.cache_resource(ttl=600)
+def prefetch_all() -> ThreadPoolExecutor:
+    """
+    Starts downloading every feed period in the background.
+
+    Runs once per cache window, so switching the time window afterwards hits
+    the warm `fetch_geojson_bytes` cache. Periods already stored in the
+    Parquet cache for the current bucket are skipped, since `load_frame`
+    will not download them. Streamlit serializes concurrent computations of
+    the same cache entry, so a foreground request for a feed that is still
+    downloading waits for it instead of fetching twice.
+
+    Returns:
+        The executor running the downloads.
+    """
+    bucket = int(time.time() // CACHE_TTL)
+    cache_dir = _cache_dir()
+    ex = ThreadPoolExecutor(max_workers=len(TimePeriod), thread_name_prefix="prefetch")
+    for period in TimePeriod:
+        if cache_dir and os.path.exists(_cache_path(period, bucket)):
+            continue
+        future = ex.submit(fetch_geojson_bytes, period)
+        future.add_done_callback(lambda f, period=period: _log_prefetch_result(period, f))
+    ex.shutdown(wait=False)
+    return ex
+
+def _convert(period: TimePeriod) -> pd.DataFrame:
+    """Fetches a feed and converts it, using the Arrow reader for large periods."""
+    if period in ARROW_PERIODS:
+        try:
+            return arrow_geojson_to_dataframe(fetch_geojson_bytes(period))
+        except pa.ArrowException as e:
+            print(f"[Flow] Arrow conversion failed, falling back. Reason: {e}")
+    return validate_and_convert_geojson(fetch_geojson(period))
+
+def load_frame(period: TimePeriod) -> pd.DataFrame:
+    """
+    Loads the converted earthquake DataFrame, backed by an on-disk Parquet cache.
+
+    Frames are stored per period and per 10-minute time bucket, so a cold
+    process can skip the download and JSON parsing while the bucket is still
+    current. Files from older buckets are removed when a new one is written.
+    The cache lives in a private per-user directory and is skipped if that
+    directory cannot be verified.
+
+    Args:
+        period: The time period for the data (TimePeriod.DAY, .WEEK, or .MONTH).
+
+    Returns:
+        A Pandas DataFrame with cleaned and structured earthquake data.
+    """
+    bucket = int(time.time() // CACHE_TTL)
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return _convert(period)
+
+    path = _cache_path(period, bucket)
+    if os.path.exists(path):
+        try:
+            df = pd.read_parquet(path, engine="pyarrow")
+            print(f"[Cache] Loaded {len(df)} records from {path}.")
+            return df
+        except Exception as e:
+            print(f"[Cache] Ignoring unreadable cache file {path}. Reason: {e}")
+
+    df = _convert(period)
+    if df.empty:
+        return df
+
+    # Write to an exclusively created temporary file first so readers never
+    # see a partial file
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        os.close(fd)
+    except OSError as e:
+        print(f"[Cache] Could not create a temporary file in {cache_dir}. Reason: {e}")
+        return df
+    try:
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"[Cache] Could not write cache file {path}. Reason: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return df
+
+    # Only reap older buckets; a newer one may just have been written by
+    # another process
+    prefix = f"usgs_{period.value}_"
+    for old in glob.glob(_cache_path(period, "*")):
+        old_bucket = os.path.basename(old)[len(prefix):-len(".parquet")]
+        if not old_bucket.isdigit() or int(old_bucket) >= bucket:
+            continue
+        try:
+            os.remove(old)
+        except FileNotFoundError:
+            pass  # Already reaped by another process
+        except OSError as e:
+            print(f"[Cache] Could not remove stale cache file {old}. Reason: {e}")
+    return df
+
+@st.cache_data(ttl=600)
+def load_prepared(period: TimePeriod) -> pd.DataFrame:
+    """
+    Fetches, converts and decorates the earthquake data for a time period.
+
+    Args:
+        period: The time period for the data (TimePeriod.DAY, .WEEK, or .MONTH).
+
+    Returns:
+        A Pandas DataFrame with the earthquake data plus a uint8 `mag_cat`
+        color palette index and an int32 `radius` column.
+    """
+    df = load_frame(period)
+    if "mag" not in df.columns:
+        return df
+
+    # Apply visual mappings for color and radius
+    mags = df["mag"].to_numpy(dtype="float64", na_value=float("nan"))
+    df["mag_cat"] = categories_from_mags(mags)
+    df["radius"] = radii_from_mags(mags)
+
+    # Positions only feed the layer, so single precision is plenty. `mag` and
+    # `depth_km` stay float64 because they are printed in the tooltip.
+    df["longitude"] = df["longitude"].astype(np.float32)
+    df["latitude"] = df["latitude"].astype(np.float32)
+    return df
+
+@st.cache_data(ttl=600, max_entries=64)
+def prepare(period: TimePeriod, mag_bucket: float) -> tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+    """
+    Filters the prepared data to a magnitude bucket and packs its layer buffers.
+
+    Callers round the slider value down to a bucket, so nearby slider
+    positions share one cache entry and only need a final exact mask. Only
+    columnar arrays are cached, which keep cache hits cheap to unpickle; the
+    JSON-ready layer payload is built after the exact mask.
+
+    Args:
+        period: The time period for the data (TimePeriod.DAY, .WEEK, or .MONTH).
+        mag_bucket: The lower magnitude bound of the bucket.
+
+    Returns:
+        A tuple of the filtered DataFrame and its row-aligned `layer_buffers`
+        positions and colors arrays.
+    """
+    df = load_prepared(period)
+    if "mag" not in df.columns:
+        return df, np.empty((0, 2), np.float32), np.empty((0, 4), np.uint8)
+
+    sub = df[df["mag"].fillna(-1).ge(mag_bucket)]
+    positions, colors = layer_buffers(sub)
+    return sub, positions, colors
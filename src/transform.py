@@ -6,44 +6,82 @@ from the USGS API into a flat, tabular format suitable for analysis and
 visualization.
 """
 
+from array import array
+import io
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.json as pj
 
-def validate_and_convert_geojson(geojson: dict) -> pd.DataFrame:
+# The subset of the USGS feature schema the app uses; other fields are ignored.
+_ARROW_SCHEMA = pa.schema([
+    ("features", pa.list_(pa.struct([
+        ("id", pa.string()),
+        ("properties", pa.struct([
+            ("mag", pa.float64()),
+            ("place", pa.string()),
+            ("time", pa.int64()),
+            ("url", pa.string()),
+        ])),
+        ("geometry", pa.struct([
+            ("coordinates", pa.list_(pa.float64())),
+        ])),
+    ]))),
+])
+
+def geojson_to_columns(geojson: dict) -> dict[str, np.ndarray]:
     """
-    Converts and validates GeoJSON data to a Pandas DataFrame.
+    Extracts the relevant GeoJSON feature fields into typed column arrays.
 
-    This function iterates through the features in the GeoJSON data, validates
-    their structure, and extracts the relevant fields into a structured DataFrame.
-    Malformed features are skipped.
+    Numeric fields are appended straight into `array.array` buffers and
+    exposed as NumPy arrays without copying, so each feature is visited once
+    and no per-row Python objects are kept around. Malformed features are
+    skipped.
 
     Args:
         geojson: A dictionary containing GeoJSON data from the USGS feed.
 
     Returns:
-        A Pandas DataFrame with cleaned and structured earthquake data.
+        A dictionary mapping column names to NumPy arrays of equal length.
+        Times are kept as raw epoch milliseconds under `time_ms`.
     """
     feats = geojson.get("features", [])
-    rows, skipped_count = [], 0
+    ids, place, url = [], [], []
+    time_ms, lon, lat, depth, mag = (
+        array("q"), array("d"), array("d"), array("d"), array("d")
+    )
+    skipped_count = 0
+    nan = float("nan")
+
+    # Bind the append methods once instead of looking them up per feature
+    ids_append, place_append, url_append = ids.append, place.append, url.append
+    time_append, lon_append, lat_append = time_ms.append, lon.append, lat.append
+    depth_append, mag_append = depth.append, mag.append
 
     for f in feats:
         try:
-            # Structural validation
+            # Structural validation; unpacking raises ValueError unless there
+            # are exactly 3 coordinates
             props = f["properties"]
-            coords = f["geometry"]["coordinates"]
-            if len(coords) != 3:
-                raise ValueError(f"Coordinates list has {len(coords)} items, expected 3.")
-
-            # Append validated data
-            rows.append({
-                "event_id": f.get("id"),
-                "time": pd.to_datetime(props["time"], unit="ms", utc=True),
-                "longitude": coords[0],
-                "latitude": coords[1],
-                "depth_km": coords[2],
-                "mag": props.get("mag"),
-                "place": props.get("place"),
-                "url": props.get("url"),
-            })
+            x, y, z = f["geometry"]["coordinates"]
+            x, y = float(x), float(y)
+            z = nan if z is None else float(z)  # Depth may be unknown
+            t = int(props["time"])
+            props_get = props.get
+            m = props_get("mag")
+            m = nan if m is None else float(m)
+
+            # Append validated data column by column
+            ids_append(f.get("id"))
+            time_append(t)
+            lon_append(x)
+            lat_append(y)
+            depth_append(z)
+            mag_append(m)
+            place_append(props_get("place"))
+            url_append(props_get("url"))
         except (KeyError, TypeError, ValueError) as e:
             skipped_count += 1
             print(f"[Validation] Skipping malformed feature: {f.get('id', 'N/A')}. Reason: {e}")
@@ -51,8 +89,115 @@ def validate_and_convert_geojson(geojson: dict) -> pd.DataFrame:
     if skipped_count > 0:
         print(f"[Validation] Skipped a total of {skipped_count} malformed records.")
 
-    if not rows:
+    return {
+        "event_id": np.array(ids, dtype=object),
+        "time_ms": np.frombuffer(time_ms, dtype=np.int64),
+        "longitude": np.frombuffer(lon, dtype=np.float64),
+        "latitude": np.frombuffer(lat, dtype=np.float64),
+        "depth_km": np.frombuffer(depth, dtype=np.float64),
+        "mag": np.frombuffer(mag, dtype=np.float64),
+        "place": np.array(place, dtype=object),
+        "url": np.array(url, dtype=object),
+    }
+
+def _columns_to_dataframe(cols: dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Assembles extracted columns into a DataFrame ordered from most recent to oldest.
+
+    The rows are ordered by sorting the raw int64 `time_ms` values, which is
+    cheaper than sorting a tz-aware datetime column; the `time` column is
+    then materialized once, already in order.
+    """
+    time_ms = cols.pop("time_ms")
+    order = np.argsort(-time_ms, kind="stable")
+    df = pd.DataFrame({name: col[order] for name, col in cols.items()})
+    df.insert(1, "time", pd.to_datetime(time_ms[order], unit="ms", utc=True))
+    return df
+
+def validate_and_convert_geojson(geojson: dict) -> pd.DataFrame:
+    """
+    Converts and validates GeoJSON data to a Pandas DataFrame.
+
+    The features are first extracted into typed columns by
+    `geojson_to_columns`, then assembled into a DataFrame sorted from most
+    recent to oldest.
+
+    Args:
+        geojson: A dictionary containing GeoJSON data from the USGS feed.
+
+    Returns:
+        A Pandas DataFrame with cleaned and structured earthquake data.
+    """
+    cols = geojson_to_columns(geojson)
+    if not len(cols["event_id"]):
+        return pd.DataFrame()
+    return _columns_to_dataframe(cols)
+
+def arrow_geojson_to_dataframe(raw: bytes) -> pd.DataFrame:
+    """
+    Converts a raw GeoJSON payload to a Pandas DataFrame using Arrow's JSON reader.
+
+    The payload is parsed against a fixed schema straight into Arrow arrays,
+    so no per-feature Python objects are created. This pays off for large,
+    homogeneous feeds such as the monthly one. Features without a time, with
+    other than 3 coordinates or with a null longitude/latitude are skipped,
+    matching `validate_and_convert_geojson`.
+
+    Args:
+        raw: The undecoded GeoJSON response body from the USGS feed.
+
+    Returns:
+        A Pandas DataFrame with the same columns as `validate_and_convert_geojson`.
+
+    Raises:
+        pyarrow.ArrowInvalid: If the payload does not match the expected schema.
+    """
+    table = pj.read_json(
+        io.BytesIO(raw),
+        read_options=pj.ReadOptions(block_size=len(raw) + 1),
+        parse_options=pj.ParseOptions(
+            explicit_schema=_ARROW_SCHEMA,
+            unexpected_field_behavior="ignore",
+            newlines_in_values=True,
+        ),
+    )
+    feats = pc.list_flatten(table.column("features")).combine_chunks()
+    props = pc.struct_field(feats, "properties")
+    coords = pc.struct_field(feats, ["geometry", "coordinates"])
+
+    valid = pc.and_(
+        pc.is_valid(props.field("time")),
+        pc.equal(pc.fill_null(pc.list_value_length(coords), 0), 3),
+    )
+    valid = pc.fill_null(valid, False).to_numpy(zero_copy_only=False)
+
+    # A null longitude or latitude, e.g. [null, 2, 3], makes the feature
+    # malformed; a null depth is kept as NaN like in the dict path
+    flat = pc.list_flatten(coords)
+    parents = pc.list_parent_indices(coords).to_numpy()
+    offsets = coords.offsets.to_numpy()
+    null_idx = np.flatnonzero(pc.is_null(flat).to_numpy(zero_copy_only=False))
+    null_pos = offsets[0] + null_idx - offsets[parents[null_idx]]
+    valid[parents[null_idx[null_pos < 2]]] = False
+
+    skipped_count = len(feats) - int(valid.sum())
+    if skipped_count > 0:
+        print(f"[Validation] Skipped a total of {skipped_count} malformed records.")
+
+    feats = feats.filter(valid)
+    if not len(feats):
         return pd.DataFrame()
 
-    df = pd.DataFrame(rows).dropna(subset=["latitude", "longitude"])
-    return df.sort_values("time", ascending=False)
+    props = feats.field("properties")
+    xyz = pc.list_flatten(feats.field("geometry").field("coordinates"))
+    xyz = xyz.to_numpy(zero_copy_only=False).reshape(-1, 3)
+    return _columns_to_dataframe({
+        "event_id": feats.field("id").to_numpy(zero_copy_only=False),
+        "time_ms": props.field("time").to_numpy(),
+        "longitude": xyz[:, 0],
+        "latitude": xyz[:, 1],
+        "depth_km": xyz[:, 2],
+        "mag": props.field("mag").to_numpy(zero_copy_only=False),
+        "place": props.field("place").to_numpy(zero_copy_only=False),
+        "url": props.field("url").to_numpy(zero_copy_only=False),
+    })
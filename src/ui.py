@@ -8,6 +8,20 @@ map visualization using Streamlit and Pydeck.
 import streamlit as st
 import pydeck as pdk
 from src.enums import TimePeriod
+from src.viz import aggregation_layer, globe_layer
+
+# Above this many points the deck is embedded as static HTML, which pans and
+# zooms far more smoothly than st.pydeck_chart at the cost of view-state
+# persistence across reruns.
+HTML_MAP_MIN_ROWS = 20_000
+
+# Above this many points the individual markers are replaced by hexagon bins.
+AGGREGATE_MIN_ROWS = 10_000
+
+# The data table only ships this many rows unless the user asks for all of
+# them, which is offered for results up to FULL_TABLE_MAX_ROWS.
+TABLE_MAX_ROWS = 1000
+FULL_TABLE_MAX_ROWS = 5000
 
 def sidebar():
     """
@@ -29,31 +43,51 @@ def sidebar():
     min_mag = st.sidebar.slider("Min magnitude", 0.0, 8.0, 3.0, 0.1, key="min_mag")
     return period, min_mag
 
-def render_map(df):
+def render_map(df, buffers=None):
     """
     Renders the Pydeck map with earthquake data.
 
+    Dense results are drawn as hexagon bins instead of individual points.
+
     Args:
         df: A Pandas DataFrame containing the earthquake data to display.
+        buffers: Optional prebuilt `layer_buffers` arrays for `df`.
     """
     view = pdk.ViewState(latitude=0, longitude=0, zoom=1.7)
+    if len(df) > AGGREGATE_MIN_ROWS:
+        layer = aggregation_layer(df, buffers)
+        html = "<b>Earthquakes</b>: {colorValue}"
+    else:
+        layer = globe_layer(df, buffers)
+        html = "<b>Mag</b>: {mag}<br/><b>Depth</b>: {depth_km} km<br/><b>When</b>: {time}<br/><b>Where</b>: {place}"
     tooltip = {
-        "html": "<b>Mag</b>: {mag}<br/><b>Depth</b>: {depth_km} km<br/><b>When</b>: {time}<br/><b>Where</b>: {place}",
+        "html": html,
         "style": {"color": "white"}
     }
     deck = pdk.Deck(
         map_style=None,  # globe
         initial_view_state=view,
-        layers=[
-            pdk.Layer(
-                "ScatterplotLayer",
-                data=df,
-                get_position="[longitude, latitude]",
-                get_radius="radius",
-                get_fill_color="[mag_r, mag_g, mag_b, mag_a]",
-                pickable=True,
-            )
-        ],
+        layers=[layer],
         tooltip=tooltip,
     )
-    st.pydeck_chart(deck, use_container_width=True)
+    if len(df) > HTML_MAP_MIN_ROWS:
+        st.iframe(deck.to_html(as_string=True), height=650)
+    else:
+        st.pydeck_chart(deck, use_container_width=True)
+
+
+def render_table(df):
+    """
+    Renders the raw earthquake data table, capped to the most recent events.
+
+    Args:
+        df: A Pandas DataFrame containing the earthquake data, sorted by time.
+    """
+    st.subheader("Raw Data")
+    show_all = False
+    if TABLE_MAX_ROWS < len(df) <= FULL_TABLE_MAX_ROWS:
+        show_all = st.checkbox("Show full table", key="show_full_table")
+    table_df = df if show_all else df.head(TABLE_MAX_ROWS)
+    if len(table_df) < len(df):
+        st.caption(f"Showing the {len(table_df):,} most recent of {len(df):,} earthquakes.")
+    st.dataframe(table_df, use_container_width=True)